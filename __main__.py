@@ -1426,6 +1426,8 @@ class NewsAnalyzer:
                         "url": item.url,
                         "title": item.title,
                         "abstract": abstract,
+                        # 已有摘要被判定为脏数据时，跳过摘要缓存强制重新生成
+                        "refresh": needs_regen,
                     })
 
         # 批量生成短摘要，并写回数据库缓存（失败则静默降级为截断摘要）
@@ -1434,13 +1436,18 @@ class NewsAnalyzer:
                 from trendradar.ai.paper_summarizer import PaperSummarizer, PaperSummaryRequest
 
                 ai_cfg = self.ctx.config.get("AI", {})
-                summarizer = PaperSummarizer(ai_cfg, max_chars=100)
+                summarizer = PaperSummarizer(
+                    ai_cfg,
+                    max_chars=100,
+                    cache_path=str(Path(self.storage_manager.data_dir) / "paper_summary_cache.json"),
+                )
 
                 reqs = [
                     PaperSummaryRequest(
                         key=x["key"],
                         title=x.get("title", ""),
                         abstract=x.get("abstract", ""),
+                        refresh=x.get("refresh", False),
                     )
                     for x in to_summarize
                 ]
@@ -0,0 +1,18 @@
+# coding=utf-8
+from trendradar.crawler.rss.huggingface_papers import _strip_tags, parse_hf_daily_papers
+
+
+def test_strip_tags_removes_script_blocks():
+    text = _strip_tags('<p>see 2602.05400</p><script>var x = "2602.99999";</script>')
+    assert "2602.05400" in text
+    assert "2602.99999" not in text
+
+
+def test_last_resort_scan_ignores_ids_inside_script():
+    html = (
+        "<html><body><p>see 2602.05400</p>"
+        '<script>window.data = {"id": "2602.99999"};</script>'
+        "<style>.x{}</style><noscript>2602.88888</noscript></body></html>"
+    )
+    items = parse_hf_daily_papers(html, "https://huggingface.co/papers")
+    assert [item.guid for item in items] == ["hf-papers:2602.05400"]
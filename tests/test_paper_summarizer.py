@@ -0,0 +1,124 @@
+# coding=utf-8
+from trendradar.ai import paper_summarizer
+from trendradar.ai.paper_summarizer import PaperSummarizer, PaperSummaryRequest, _extract_json
+
+AI_CONFIG = {"MODEL": "openai/test-model", "API_KEY": "test-key"}
+
+
+def test_extract_json_plain():
+    assert _extract_json('{"a":1}') == '{"a":1}'
+
+
+def test_extract_json_unclosed_fence():
+    assert _extract_json('```json\n{"a":1}') == '{"a":1}'
+
+
+def test_extract_json_prefers_json_fence_over_earlier_fence():
+    text = '```python\nx\n```\n```json\n{"a":1}\n```'
+    assert _extract_json(text) == '{"a":1}'
+
+
+def test_extract_json_inline_fences_before_json_fence():
+    text = 'pre ``` inline``` then ```json{"a":1}```'
+    assert _extract_json(text) == '{"a":1}'
+
+
+def test_extract_json_generic_fence():
+    assert _extract_json('```\n{"a":1}\n```') == '{"a":1}'
+
+
+def _make_summarizer(cache_path, ai_config=AI_CONFIG, **kwargs):
+    summarizer = PaperSummarizer(ai_config, cache_path=str(cache_path), **kwargs)
+    calls = []
+
+    def fake_call_ai_batch(items):
+        calls.extend(item["key"] for item in items)
+        return {item["key"]: f"摘要：{item['title']}" for item in items}
+
+    summarizer._call_ai_batch = fake_call_ai_batch
+    return summarizer, calls
+
+
+def _req(key, title="Paper Title", abstract="Some abstract.", refresh=False):
+    return PaperSummaryRequest(key=key, title=title, abstract=abstract, refresh=refresh)
+
+
+def test_summary_cache_miss_calls_ai(tmp_path):
+    summarizer, calls = _make_summarizer(tmp_path / "cache.json")
+    out = summarizer.summarize_batch([_req("a")])
+    assert out == {"a": "摘要：Paper Title"}
+    assert calls == ["a"]
+
+
+def test_summary_cache_hit_skips_ai(tmp_path):
+    summarizer, calls = _make_summarizer(tmp_path / "cache.json")
+    summarizer.summarize_batch([_req("a")])
+    out = summarizer.summarize_batch([_req("b")])
+    assert out == {"b": "摘要：Paper Title"}
+    assert calls == ["a"]
+    assert summarizer._last_is_fallback is False
+
+
+def test_summary_cache_persists_across_instances(tmp_path):
+    cache_path = tmp_path / "sub" / "cache.json"
+    first, _ = _make_summarizer(cache_path)
+    first.summarize_batch([_req("a")])
+    assert cache_path.exists()
+
+    second, calls = _make_summarizer(cache_path)
+    assert second.summarize_batch([_req("a")]) == {"a": "摘要：Paper Title"}
+    assert calls == []
+
+
+def test_summary_cache_hit_truncates_to_instance_max_chars(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    short, _ = _make_summarizer(cache_path, max_chars=4)
+    assert short.summarize_batch([_req("a")]) == {"a": "摘要：P"}
+
+    long, calls = _make_summarizer(cache_path, max_chars=100)
+    assert long.summarize_batch([_req("a")]) == {"a": "摘要：Paper Title"}
+    assert calls == []
+
+
+def test_summary_cache_is_keyed_on_model(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    first, _ = _make_summarizer(cache_path)
+    first.summarize_batch([_req("a")])
+
+    other_model = dict(AI_CONFIG, MODEL="openai/other-model")
+    second, calls = _make_summarizer(cache_path, ai_config=other_model)
+    second.summarize_batch([_req("a")])
+    assert calls == ["a"]
+
+
+def test_summary_cache_refresh_bypasses_and_replaces_entry(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    summarizer, calls = _make_summarizer(cache_path)
+    summarizer._call_ai_batch = lambda items: {item["key"]: "Bad English summary" for item in items}
+    summarizer.summarize_batch([_req("a")])
+
+    summarizer, calls = _make_summarizer(cache_path)
+    out = summarizer.summarize_batch([_req("a", refresh=True)])
+    assert out == {"a": "摘要：Paper Title"}
+    assert calls == ["a"]
+
+    summarizer, calls = _make_summarizer(cache_path)
+    assert summarizer.summarize_batch([_req("b")]) == {"b": "摘要：Paper Title"}
+    assert calls == []
+
+
+def test_summary_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(paper_summarizer, "SUMMARY_CACHE_MAX_ENTRIES", 2)
+    cache_path = tmp_path / "cache.json"
+    summarizer, _ = _make_summarizer(cache_path)
+    summarizer.summarize_batch([_req("a", title="Paper A")])
+    summarizer.summarize_batch([_req("b", title="Paper B")])
+    # 命中 A，使 B 成为最久未使用的条目
+    summarizer.summarize_batch([_req("a", title="Paper A")])
+    summarizer.summarize_batch([_req("c", title="Paper C")])
+
+    reloaded, calls = _make_summarizer(cache_path)
+    reloaded.summarize_batch([_req("a", title="Paper A"), _req("c", title="Paper C")])
+    assert calls == []
+    reloaded.summarize_batch([_req("b", title="Paper B")])
+    assert calls == ["b"]
@@ -8,22 +8,46 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from trendradar.ai.client import AIClient
 
-BATCH_SIZE = 10
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+# 小批次 + 并发：多个短请求在服务端重叠执行，单批延迟更低
+BATCH_SIZE = 4
+MAX_CONCURRENCY = 4
 FALLBACK_MAX_CHARS = 200
+# 单条 abstract 送入 prompt 的长度上下限，以及每批 abstract 的总字符预算
+ABSTRACT_MAX_CHARS = 1200
+ABSTRACT_MIN_CHARS = 400
+BATCH_ABSTRACT_BUDGET = 3200
+# 持久化摘要缓存的最大条目数（超出时淘汰最久未使用的条目）
+SUMMARY_CACHE_MAX_ENTRIES = 5000
+
+_WS_RE = re.compile(r"\s+")
+# 句子断点，按优先级排列（越靠前越优先）
+_SENT_SEPS = (". ", "。", "；", "; ", ", ", "，")
+# 优先取 ```json ... ``` 围栏，其次取第一个 ``` ... ``` 围栏；缺少结尾围栏时取到文本末尾
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)(?:```|\Z)", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
 
 
 def _strip_ws(text: str) -> str:
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
 def _truncate_chars(text: str, max_chars: int) -> str:
@@ -44,7 +68,7 @@ def _truncate_at_sentence(text: str, max_chars: int) -> str:
         return text
 
     chunk = text[:max_chars]
-    for sep in [". ", "。", "；", "; ", ", ", "，"]:
+    for sep in _SENT_SEPS:
         pos = chunk.rfind(sep)
         if pos > max_chars // 3:
             return chunk[: pos + len(sep)].rstrip()
@@ -60,15 +84,20 @@ def _extract_json(text: str) -> str:
     if not text:
         return ""
     raw = text.strip()
-    if "```json" in raw:
-        part = raw.split("```json", 1)[1]
-        end = part.find("```")
-        return (part[:end] if end != -1 else part).strip()
-    if "```" in raw:
-        parts = raw.split("```", 2)
-        if len(parts) >= 2:
-            return parts[1].strip()
-    return raw
+    m = _JSON_FENCE_RE.search(raw) or _FENCE_RE.search(raw)
+    return m.group(1).strip() if m else raw
+
+
+def _json_dumps(obj: Any) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _json_loads(text: str) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 @dataclass
@@ -76,17 +105,72 @@ class PaperSummaryRequest:
     key: str
     title: str
     abstract: str
+    # 为 True 时跳过摘要缓存查找（调用方判定已有摘要为脏数据需要重生成）
+    refresh: bool = False
 
 
 class PaperSummarizer:
-    def __init__(self, ai_config: Dict[str, Any], max_chars: int = 100):
+    def __init__(
+        self,
+        ai_config: Dict[str, Any],
+        max_chars: int = 100,
+        batch_size: int = BATCH_SIZE,
+        max_concurrency: int = MAX_CONCURRENCY,
+        cache_path: Optional[str] = None,
+    ):
         self.ai_config = ai_config or {}
         self.max_chars = max_chars
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
         self.client = AIClient(self.ai_config)
+        self._ai_ok: Optional[bool] = None
+        self._last_is_fallback = False
+        self.cache_path = cache_path
+        self._cache: Dict[str, str] = self._load_cache()
+        self._cache_dirty = False
+
+    def _cache_key(self, req: PaperSummaryRequest) -> str:
+        # 包含模型标识：切换 AI 模型后旧摘要不再命中
+        raw = f"{self.client.model}\x1e{_strip_ws(req.title)}\x1e{_strip_ws(req.abstract)}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _load_cache(self) -> Dict[str, str]:
+        """读取持久化的 AI 摘要缓存（{hash: summary}），失败时返回空缓存。"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = _json_loads(f.read())
+        except Exception as e:
+            print(f"[RSS] 读取论文摘要缓存失败，忽略: {e}")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {str(k): str(v) for k, v in data.items() if v}
+
+    def _save_cache(self) -> None:
+        if not self.cache_path or not self._cache_dirty:
+            return
+        # dict 保持插入顺序，最久未使用的条目在最前
+        while len(self._cache) > SUMMARY_CACHE_MAX_ENTRIES:
+            self._cache.pop(next(iter(self._cache)))
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(_json_dumps(self._cache))
+            os.replace(tmp_path, self.cache_path)
+            self._cache_dirty = False
+        except Exception as e:
+            print(f"[RSS] 写入论文摘要缓存失败: {e}")
 
     def _ai_enabled(self) -> bool:
-        ok, _ = self.client.validate_config()
-        return ok
+        # 配置在实例生命周期内不变，只校验一次
+        if self._ai_ok is None:
+            self._ai_ok, _ = self.client.validate_config()
+        return self._ai_ok
 
     def _fallback_summary(self, req: PaperSummaryRequest) -> str:
         """AI 不可用时，从 abstract 或 title 截断生成 fallback 摘要。"""
@@ -111,7 +195,7 @@ class PaperSummarizer:
             "- 若信息不足，用标题信息做合理概括\n"
             "\n"
             "输入 JSON 数组：\n"
-            f"{json.dumps(items, ensure_ascii=False)}\n"
+            f"{_json_dumps(items)}\n"
             "\n"
             "输出 JSON 对象，key 为输入的 key，value 为摘要字符串：\n"
             '{"<key>":"<summary>"}'
@@ -129,7 +213,7 @@ class PaperSummarizer:
         )
 
         json_str = _extract_json(resp)
-        data = json.loads(json_str)
+        data = _json_loads(json_str)
         if not isinstance(data, dict):
             return {}
         return data
@@ -143,54 +227,90 @@ class PaperSummarizer:
         if not reqs:
             return {}
 
+        self._last_is_fallback = False
+
+        # 先查持久化缓存：同一篇论文（标题+摘要相同）不再重复调用 AI
+        out: Dict[str, str] = {}
+        cache_key_by_req: Dict[str, str] = {}
+        to_query: List[PaperSummaryRequest] = []
+        for r in reqs:
+            ck = self._cache_key(r)
+            hit = self._cache.pop(ck, None)
+            if r.refresh and hit is not None:
+                # 强制重生成：丢弃旧条目，避免其它请求继续命中脏数据
+                hit = None
+                self._cache_dirty = True
+            if hit:
+                self._cache[ck] = hit  # 移到末尾，标记为最近使用
+                self._cache_dirty = True
+                out[r.key] = _truncate_chars(hit, self.max_chars)
+            else:
+                cache_key_by_req[r.key] = ck
+                to_query.append(r)
+        if out:
+            print(f"[RSS] 论文摘要缓存命中 {len(out)} 条")
+        reqs = to_query
+        if not reqs:
+            self._save_cache()
+            return out
+
         use_ai = self._ai_enabled()
         if not use_ai:
             print("[RSS] AI 未配置，使用 abstract/title 截断作为短摘要（不写入缓存）")
-            out = {}
             for r in reqs:
                 fb = self._fallback_summary(r)
                 if fb:
                     out[r.key] = fb
             self._last_is_fallback = True
+            self._save_cache()
             return out
 
-        self._last_is_fallback = False
+        # 每批 prompt 中 abstract 总长度大致恒定：批次越大，单条 abstract 越短
+        per_batch = min(self.batch_size, len(reqs))
+        abstract_budget = min(
+            ABSTRACT_MAX_CHARS,
+            max(ABSTRACT_MIN_CHARS, BATCH_ABSTRACT_BUDGET // per_batch),
+        )
 
         prep = {}
         for r in reqs:
             title = _strip_ws(r.title)
-            abstract = _truncate_chars(r.abstract, 1200)
+            abstract = _truncate_chars(r.abstract, abstract_budget)
             prep[r.key] = {"key": r.key, "title": title, "abstract": abstract}
 
         keys = list(prep.keys())
-        out: Dict[str, str] = {}
-
-        for i in range(0, len(keys), BATCH_SIZE):
-            batch_keys = keys[i : i + BATCH_SIZE]
-            batch_items = [prep[k] for k in batch_keys]
-            batch_reqs = {r.key: r for r in reqs if r.key in batch_keys}
+        req_by_key = {r.key: r for r in reqs}
+        batches = [keys[i : i + self.batch_size] for i in range(0, len(keys), self.batch_size)]
+
+        # 各批次相互独立，并发调用 AI，总耗时约为最慢一批的耗时
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as pool:
+            futures = {
+                pool.submit(self._call_ai_batch, [prep[k] for k in batch_keys]): (idx, batch_keys)
+                for idx, batch_keys in enumerate(batches)
+            }
+            for fut in as_completed(futures):
+                idx, batch_keys = futures[fut]
+                try:
+                    ai_result = fut.result()
+                except Exception as e:
+                    print(f"[RSS] AI 批次调用失败（第 {idx + 1} 批），降级为截断: {e}")
+                    for k in batch_keys:
+                        out[k] = self._fallback_summary(req_by_key[k])
+                    self._last_is_fallback = True
+                    continue
 
-            try:
-                ai_result = self._call_ai_batch(batch_items)
-            except Exception as e:
-                print(f"[RSS] AI 批次调用失败（第 {i // BATCH_SIZE + 1} 批），降级为截断: {e}")
                 for k in batch_keys:
-                    r = batch_reqs.get(k)
-                    if r:
-                        out[k] = self._fallback_summary(r)
-                self._last_is_fallback = True
-                continue
-
-            for k in batch_keys:
-                v = ai_result.get(k, "")
-                v = _strip_ws(str(v))
-                v = v.replace("\n", " ").replace("\r", " ")
-                if v:
-                    out[k] = _truncate_chars(v, self.max_chars)
-                else:
-                    r = batch_reqs.get(k)
-                    if r:
-                        out[k] = self._fallback_summary(r)
+                    v = ai_result.get(k, "")
+                    # _strip_ws 已将 \n/\r 等空白折叠为单个空格
+                    v = _strip_ws(str(v))
+                    if v:
+                        out[k] = _truncate_chars(v, self.max_chars)
+                        # 仅缓存 AI 生成的结果（未截断，命中时按 max_chars 截断），fallback 不入缓存
+                        self._cache[cache_key_by_req[k]] = v
+                        self._cache_dirty = True
+                    else:
+                        out[k] = self._fallback_summary(req_by_key[k])
                         self._last_is_fallback = True
 
+        self._save_cache()
         return out
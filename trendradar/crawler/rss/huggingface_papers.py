@@ -16,10 +16,45 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .parser import ParsedRSSItem
 
-
-_ARXIV_ID_RE = re.compile(r"\b(\d{4}\.\d{5})\b")
-_HF_PAPERS_PATH_RE = re.compile(r"/papers/(\d{4}\.\d{5})\b")
-_HF_DATE_RE = re.compile(r"/papers/date/(\d{4}-\d{2}-\d{2})\b")
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+
+# 纯 ASCII 的 id/日期模式使用 re.ASCII，跳过 Unicode 数字/单词字符表
+_ARXIV_ID_RE = re.compile(r"\b(\d{4}\.\d{5})\b", re.ASCII)
+_HF_PAPERS_PATH_RE = re.compile(r"/papers/(\d{4}\.\d{5})\b", re.ASCII)
+_HF_DATE_RE = re.compile(r"/papers/date/(\d{4}-\d{2}-\d{2})\b", re.ASCII)
+
+_WS_RE = re.compile(r"\s+")
+# script/style/noscript 整块（含内容）或任意单个标签，一次替换完成
+_TAG_RE = re.compile(
+    r"(?is)<(?:script|style|noscript)[^>]*>.*?</(?:script|style|noscript)>|<[^>]+>"
+)
+
+# str.find 预筛选区分大小写，因此只匹配小写的 href（HF 页面均为小写）
+_ANCHOR_PREFIX = 'href="/papers/'
+_ANCHOR_RE = re.compile(
+    r'href="/papers/(?P<id>\d{4}\.\d{5})[^"]*"[^>]*>(?P<title>[^<]{3,300})</[aA]>',
+    re.ASCII,
+)
+# upvote 计数这类只含数字的 anchor 文本（如 "333"、"1.2k"）
+_UPVOTE_RE = re.compile(r"[\d\.\-kK]+", re.ASCII)
+_PAPERS_PREFIX = "/papers/"
+_MD_RE = re.compile(
+    r"(?is)\(/papers/(?P<id>\d{4}\.\d{5})\)[^\n]*\n\s*###\s+(?P<title>.+?)\s*(?:\n|$)"
+)
+_NEXT_DATA_RE = re.compile(r'(?is)<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>')
+
+# __NEXT_DATA__ 节点中可能携带 arXiv id 的字段（按优先级）
+_ID_KEYS = ("arxivId", "arxiv_id", "paperId", "paper_id", "id", "url")
+# __NEXT_DATA__ 遍历上限：每日页面通常只有 30~60 篇论文
+_NEXT_DATA_MAX_PAPERS = 500
+_NEXT_DATA_STABLE_LIMIT = 2000
+_NEXT_DATA_MAX_NODES = 200_000
 
 
 def is_hf_daily_papers_url(url: str) -> bool:
@@ -46,21 +81,30 @@ def _published_at_for_feed(feed_url: str) -> str:
 
 def _strip_tags(s: str) -> str:
     # 轻量级去标签：用于 fallback（不引入 bs4/lxml）
-    s = re.sub(r"(?is)<(script|style|noscript)[^>]*>.*?</\\1>", " ", s)
-    s = re.sub(r"(?is)<[^>]+>", " ", s)
+    s = _TAG_RE.sub(" ", s)
     s = _html.unescape(s)
-    s = re.sub(r"\s+", " ", s)
-    return s.strip()
+    return _WS_RE.sub(" ", s).strip()
+
+
+def _json_loads(text: str) -> Any:
+    # 注意：orjson 会把超过 64 位的整数转为 float，且不接受 NaN（标准库可以）；
+    # 解析失败会被调用方吞掉并降级到后续解析层
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 def _walk_json(obj: Any) -> Iterable[Dict[str, Any]]:
-    if isinstance(obj, dict):
-        yield obj
-        for v in obj.values():
-            yield from _walk_json(v)
-    elif isinstance(obj, list):
-        for it in obj:
-            yield from _walk_json(it)
+    # 显式栈代替递归生成器（大页面的 JSON 树又深又宽）；子节点逆序入栈以保持先序遍历顺序
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        t = type(cur)
+        if t is dict:
+            yield cur
+            stack.extend(reversed(cur.values()))
+        elif t is list:
+            stack.extend(reversed(cur))
 
 
 def _extract_candidates_from_next_data(next_data: Dict[str, Any]) -> List[Tuple[str, str, Optional[str]]]:
@@ -68,16 +112,24 @@ def _extract_candidates_from_next_data(next_data: Dict[str, Any]) -> List[Tuple[
     从 Next.js 的 __NEXT_DATA__ 中尽量抽取 (arxiv_id, title, author_text)。
     该结构是内部实现，字段名可能变化，因此采用“宽松匹配 + 去重”策略。
     """
-    out: List[Tuple[str, str, Optional[str]]] = []
-
-    for d in _walk_json(next_data):
-        title = d.get("title") if isinstance(d.get("title"), str) else None
-        if not title or len(title.strip()) < 6:
+    # 去重：同一个 arxiv_id 取最长 title（更像正式标题）
+    dedup: Dict[str, Tuple[str, Optional[str]]] = {}
+    # 提前终止：论文节点连续多次未带来新结果，或数量/节点数超出上限时停止遍历
+    stable = 0
+
+    for n, d in enumerate(_walk_json(next_data)):
+        if n >= _NEXT_DATA_MAX_NODES:
+            break
+        # 绝大多数节点没有 title，先做成员判断快速跳过
+        if "title" not in d:
+            continue
+        title = d["title"]
+        if not isinstance(title, str) or len(title.strip()) < 6:
             continue
 
-        # arXiv id 可能出现在多个字段
+        # arXiv id 可能出现在多个字段（有些结构会把 URL 放在 url 字段里）
         arxiv_id = None
-        for k in ("arxivId", "arxiv_id", "paperId", "paper_id", "id", "paper_id"):
+        for k in _ID_KEYS:
             v = d.get(k)
             if isinstance(v, str):
                 m = _ARXIV_ID_RE.search(v)
@@ -85,14 +137,6 @@ def _extract_candidates_from_next_data(next_data: Dict[str, Any]) -> List[Tuple[
                     arxiv_id = m.group(1)
                     break
 
-        # 有些结构会把 URL 放在 url 字段里
-        if not arxiv_id:
-            url = d.get("url") if isinstance(d.get("url"), str) else None
-            if url:
-                m = _ARXIV_ID_RE.search(url)
-                if m:
-                    arxiv_id = m.group(1)
-
         if not arxiv_id:
             continue
 
@@ -104,22 +148,21 @@ def _extract_candidates_from_next_data(next_data: Dict[str, Any]) -> List[Tuple[
                 author = av.strip()
                 break
 
-        out.append((arxiv_id, title.strip(), author))
-
-    # 去重：同一个 arxiv_id 取最长 title（更像正式标题）
-    dedup: Dict[str, Tuple[str, Optional[str]]] = {}
-    for arxiv_id, title, author in out:
-        if arxiv_id not in dedup or len(title) > len(dedup[arxiv_id][0]):
+        title = title.strip()
+        cur = dedup.get(arxiv_id)
+        if cur is None or len(title) > len(cur[0]):
             dedup[arxiv_id] = (title, author)
+            stable = 0
+        else:
+            stable += 1
+        if stable > _NEXT_DATA_STABLE_LIMIT or len(dedup) >= _NEXT_DATA_MAX_PAPERS:
+            break
 
     return [(k, v[0], v[1]) for k, v in dedup.items()]
 
 
 def _try_parse_next_data(html: str) -> List[Tuple[str, str, Optional[str]]]:
-    m = re.search(
-        r'(?is)<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>',
-        html or "",
-    )
+    m = _NEXT_DATA_RE.search(html or "")
     if not m:
         return []
 
@@ -128,7 +171,7 @@ def _try_parse_next_data(html: str) -> List[Tuple[str, str, Optional[str]]]:
         return []
 
     try:
-        data = json.loads(raw)
+        data = _json_loads(raw)
     except Exception:
         return []
 
@@ -140,25 +183,25 @@ def _parse_from_html_links(html: str) -> List[Tuple[str, str]]:
     Fallback：从 HTML 中尽量提取 <a href="/papers/<id>">Title</a> 的 title。
     同时规避“upvote 数字链接”这类只包含数字的 anchor。
     """
-    candidates: List[Tuple[str, str]] = []
-
-    # 先尝试更“紧”的模式
-    for m in re.finditer(
-        r'(?is)href="/papers/(?P<id>\d{4}\.\d{5})(?:[^"]*)"\s*[^>]*>(?P<title>[^<]{3,300})</a>',
-        html or "",
-    ):
-        arxiv_id = m.group("id")
-        title = _html.unescape(m.group("title"))
-        title = re.sub(r"\s+", " ", title).strip()
-        if not title or re.fullmatch(r"[\d\.\-kK]+", title):
-            continue
-        candidates.append((arxiv_id, title))
-
     # 去重：同一个 id 取最长 title
     dedup: Dict[str, str] = {}
-    for arxiv_id, title in candidates:
-        if arxiv_id not in dedup or len(title) > len(dedup[arxiv_id]):
-            dedup[arxiv_id] = title
+
+    # 先用 str.find 定位候选 href，再在该位置做锚定匹配，避免整页正则扫描与回溯
+    html = html or ""
+    pos = html.find(_ANCHOR_PREFIX)
+    while pos != -1:
+        m = _ANCHOR_RE.match(html, pos)
+        if m:
+            arxiv_id = m.group("id")
+            title = _html.unescape(m.group("title"))
+            title = _WS_RE.sub(" ", title).strip()
+            if title and not _UPVOTE_RE.fullmatch(title):
+                cur = dedup.get(arxiv_id)
+                if cur is None or len(title) > len(cur):
+                    dedup[arxiv_id] = title
+            pos = html.find(_ANCHOR_PREFIX, m.end())
+        else:
+            pos = html.find(_ANCHOR_PREFIX, pos + len(_ANCHOR_PREFIX))
 
     return list(dedup.items())
 
@@ -170,27 +213,21 @@ def _parse_from_markdownish_text(text: str) -> List[Tuple[str, str]]:
       [333](.../papers/2602.05400)
       ### Title...
     """
-    candidates: List[Tuple[str, str]] = []
-    for m in re.finditer(
-        r"(?is)\(/papers/(?P<id>\d{4}\.\d{5})\)[^\n]*\n\s*###\s+(?P<title>.+?)\s*(?:\n|$)",
-        text or "",
-    ):
+    dedup: Dict[str, str] = {}
+    for m in _MD_RE.finditer(text or ""):
         arxiv_id = m.group("id")
         title = m.group("title").strip()
-        title = re.sub(r"\s+", " ", title)
+        title = _WS_RE.sub(" ", title)
         if title:
-            candidates.append((arxiv_id, title))
+            cur = dedup.get(arxiv_id)
+            if cur is None or len(title) > len(cur):
+                dedup[arxiv_id] = title
 
     # 再兜底一层：只拿到 ID 列表时也返回（title 用 paper id 占位，避免完全空）
-    if not candidates:
-        ids = sorted(set(_HF_PAPERS_PATH_RE.findall(text or "")))
-        for arxiv_id in ids:
-            candidates.append((arxiv_id, f"arXiv:{arxiv_id}"))
+    if not dedup:
+        for arxiv_id in sorted(set(_HF_PAPERS_PATH_RE.findall(text or ""))):
+            dedup[arxiv_id] = f"arXiv:{arxiv_id}"
 
-    dedup: Dict[str, str] = {}
-    for arxiv_id, title in candidates:
-        if arxiv_id not in dedup or len(title) > len(dedup[arxiv_id]):
-            dedup[arxiv_id] = title
     return list(dedup.items())
 
 
@@ -199,9 +236,14 @@ def parse_hf_daily_papers(content: str, feed_url: str) -> List[ParsedRSSItem]:
     将 Hugging Face Daily Papers 页面内容解析为 ParsedRSSItem 列表。
     """
     published_at = _published_at_for_feed(feed_url)
+    content = content or ""
+
+    # 先用廉价的子串判断跳过特征不存在的层级，避免对整页重复做 O(N) 扫描
+    has_next = "__NEXT_DATA__" in content
+    has_paper_link = _PAPERS_PREFIX in content
 
     # 1) 优先：__NEXT_DATA__（更稳定）
-    next_candidates = _try_parse_next_data(content)
+    next_candidates = _try_parse_next_data(content) if has_next else []
     if next_candidates:
         items: List[ParsedRSSItem] = []
         for arxiv_id, title, author in next_candidates:
@@ -218,7 +260,7 @@ def parse_hf_daily_papers(content: str, feed_url: str) -> List[ParsedRSSItem]:
         return items
 
     # 2) HTML anchor fallback
-    link_candidates = _parse_from_html_links(content)
+    link_candidates = _parse_from_html_links(content) if has_paper_link else []
     if link_candidates:
         return [
             ParsedRSSItem(
@@ -232,8 +274,9 @@ def parse_hf_daily_papers(content: str, feed_url: str) -> List[ParsedRSSItem]:
             for arxiv_id, title in link_candidates
         ]
 
-    # 3) markdown-ish text fallback
-    md_candidates = _parse_from_markdownish_text(content)
+    # 3) markdown-ish text fallback（_MD_RE 不区分大小写，门控也需不区分大小写）
+    has_md_link = has_paper_link or _PAPERS_PREFIX in content.lower()
+    md_candidates = _parse_from_markdownish_text(content) if has_md_link else []
     if md_candidates:
         return [
             ParsedRSSItem(
@@ -248,7 +291,7 @@ def parse_hf_daily_papers(content: str, feed_url: str) -> List[ParsedRSSItem]:
         ]
 
     # 4) 最后：完全去标签后扫 arXiv id（几乎只用于 debug）
-    text = _strip_tags(content or "")
+    text = _strip_tags(content)
     ids = sorted(set(_ARXIV_ID_RE.findall(text)))
     return [
         ParsedRSSItem(